@@ -1,6 +1,7 @@
 from fastapi import APIRouter
-from .routes import file
+from .routes import file, events
 
 api_router = APIRouter()
 
-api_router.include_router(file.router, prefix="/files", tags=["File"])
\ No newline at end of file
+api_router.include_router(file.router, prefix="/files", tags=["File"])
+api_router.include_router(events.router, prefix="/events", tags=["Event"])
\ No newline at end of file
@@ -0,0 +1,58 @@
+import asyncio
+import json
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from config.logs import LoggerManager
+from services.calendar_notifier import CalendarNotifier
+
+router = APIRouter()
+logging = LoggerManager()
+
+KEEP_ALIVE_SECONDS = 15
+RETRY_MILLISECONDS = 3000 # delay before EventSource clients reconnect after a lost connection
+
+def _format_event(event):
+    """Format a change event as a Server-Sent Event message."""
+    return f"event: calendar\nid: {event['version']}\ndata: {json.dumps(event)}\n\n"
+
+@router.get("/calendar")
+async def stream_calendar_events(request: Request):
+    client_ip = ".".join(request.client.host.split(".")[:-1] + ["x"])
+    logging.info(f"Subscribing to calendar events from {client_ip}")
+    notifier = CalendarNotifier()
+    
+    async def event_stream():
+        subscriber = None
+        try:
+            # Subscribe once the body is streamed, the finally block would not run for a dropped response
+            subscriber = notifier.subscribe()
+            _, queue = subscriber
+            yield f"retry: {RETRY_MILLISECONDS}\n\n"
+            
+            # Send the current version first so the client can compare it with its cached ETag,
+            # unless the client already received it before reconnecting
+            current_event = notifier.current_event("static/calendar.ics")
+            if current_event and current_event["version"] != request.headers.get("last-event-id"):
+                yield _format_event(current_event)
+            
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=KEEP_ALIVE_SECONDS)
+                    if event is None:
+                        break # The server is stopping
+                    yield _format_event(event)
+                except asyncio.TimeoutError:
+                    # Comment line to keep proxies from closing an idle connection
+                    yield ": keep-alive\n\n"
+        finally:
+            if subscriber:
+                notifier.unsubscribe(subscriber)
+            logging.info(f"Unsubscribed from calendar events for {client_ip}")
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,6 +1,5 @@
 import os
-from datetime import datetime, timedelta
-import hashlib
+from datetime import datetime, timedelta, timezone
 import time
 
 from fastapi import APIRouter, HTTPException, Response, status, Request
@@ -8,11 +7,47 @@ from fastapi.responses import FileResponse
 
 from config.logs import LoggerManager
 from config.settings import get_settings
+from services.calendar_archive import CalendarArchiveService
+from utils.http_cache import get_file_etag
 
 router = APIRouter()
 logging = LoggerManager()
 settings = get_settings()
 
+DATE_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
+
+def _cached_file_response(request: Request, file_path: str, filename: str, cache_headers: dict):
+    """Return the file, or a 304 Not Modified response if the client copy is still valid."""
+    file_stat = os.stat(file_path)
+    
+    # HTTP dates are in GMT with a one second precision
+    last_modified = datetime.fromtimestamp(int(file_stat.st_mtime), timezone.utc).replace(tzinfo=None)
+    headers = {
+        **cache_headers,
+        "ETag": get_file_etag(file_stat),
+        "Last-Modified": last_modified.strftime(DATE_FORMAT),
+    }
+    
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    try:
+        modified_since = datetime.strptime(if_modified_since, DATE_FORMAT) if if_modified_since else None
+    except ValueError:
+        modified_since = None # Ignore an invalid date instead of failing the request
+    
+    # If the ETag or the last modified date match the request, return a 304 Not Modified response
+    if (if_none_match and if_none_match == headers["ETag"]) or \
+       (modified_since and modified_since >= last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response = FileResponse(
+        path=file_path,
+        media_type="text/calendar",
+        filename=filename
+    )
+    response.headers.update(headers)
+    return response
+
 @router.get(
     "/calendar.ics",
     response_class=FileResponse,
@@ -23,42 +58,41 @@ async def get_calendar(request: Request):
     user_agent = request.headers.get("user-agent")
     logging.info(f"Requesting calendar receive from {client_ip} with user-agent {user_agent}")
     try:
-        file_path = "static/calendar.ics"
-        date_format = "%a, %d %b %Y %H:%M:%S GMT"
-        
-        # Check if the file exists and get its last modified date
-        file_stat = os.stat(file_path)
-        last_modified = datetime.fromtimestamp(file_stat.st_mtime)
-        last_modified_str = last_modified.strftime(date_format)
-        
-        # Generate an ETag which is a unique identifier hash for the file
-        etag = hashlib.md5(f"{file_stat.st_mtime}:{file_stat.st_size}".encode()).hexdigest()
-        
-        if_none_match = request.headers.get("if-none-match")
-        if_modified_since = request.headers.get("if-modified-since")
-        
-        # If the ETag or the last modified date match the request, return a 304 Not Modified response
-        if (if_none_match and if_none_match == etag) or \
-           (if_modified_since and datetime.strptime(if_modified_since, date_format) >= last_modified):
-            logging.info(f"Returning 304 Not Modified for {client_ip}")
-            return Response(status_code=status.HTTP_304_NOT_MODIFIED)
-        
-        response = FileResponse(
-            path=file_path,
-            media_type="text/calendar",
-            filename="calendar.ics"
-        )
-        
         # Set the cache headers
         cache_duration = timedelta(minutes=settings.BACK_CACHE_DURATION)
-        response.headers["Cache-Control"] = f"public, max-age={int(cache_duration.total_seconds())}"
-        response.headers["Expires"] = (datetime.now() + cache_duration).strftime(date_format)
-        
-        response.headers["ETag"] = etag
-        response.headers["Last-Modified"] = last_modified_str
-        logging.info(f"Returning 200 OK for {client_ip}")
+        response = _cached_file_response(request, "static/calendar.ics", "calendar.ics", {
+            "Cache-Control": f"public, max-age={int(cache_duration.total_seconds())}",
+            "Expires": (datetime.now(timezone.utc) + cache_duration).strftime(DATE_FORMAT),
+        })
+        logging.info(f"Returning {response.status_code} for {client_ip}")
         return response
         
     except Exception as e:
         logging.error(f"Error with the calendar for {client_ip}: {e}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error with the calendar")
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error with the calendar")
+
+@router.get(
+    "/archive/{season}.ics",
+    response_class=FileResponse,
+    status_code=200
+)
+async def get_archive(season: int, request: Request):
+    client_ip = ".".join(request.client.host.split(".")[:-1] + ["x"])
+    logging.info(f"Requesting archive {season} receive from {client_ip}")
+    
+    # Season files are only generated once the season is over
+    file_path = CalendarArchiveService.season_file_path(season)
+    if not file_path:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Archive not found")
+    
+    try:
+        # Season files never change, clients can keep them forever
+        response = _cached_file_response(request, file_path, f"calendar-{season}.ics", {
+            "Cache-Control": "public, max-age=31536000, immutable",
+        })
+        logging.info(f"Returning {response.status_code} for {client_ip}")
+        return response
+        
+    except Exception as e:
+        logging.error(f"Error with the archive {season} for {client_ip}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error with the archive")
\ No newline at end of file
@@ -21,6 +21,11 @@ class Settings(BaseSettings):
     BACK_PANDA_API_KEY: str
     BACK_PANDA_REFRESH_INTERVAL: int
     
+    BACK_CALENDAR_LIVE_DAYS: int = Field(default=30, ge=0) # past days kept in the live calendar before archiving
+    
+    BACK_WEBHOOK_URL: str | None = None # optional URL receiving calendar change events
+    BACK_WEBHOOK_SECRET: str | None = None # optional secret used to sign webhook bodies
+    
     model_config = SettingsConfigDict(env_file=".env") # load settings from .env file
     
     
@@ -1,3 +1,6 @@
+import asyncio
+import signal
+import threading
 import time
 import subprocess
 
@@ -9,6 +12,22 @@ from config.logs import LoggerManager
 from api.router import api_router
 from tasks.scheduler_manager import start_scheduler, stop_scheduler
 from services.esport_calendar import EsportCalendarService
+from services.calendar_notifier import CalendarNotifier
+
+def _run_before_signal_handler(sig, callback):
+    """Run the callback before the handler installed by the server for the signal."""
+    # Signal handlers can only be set from the main thread
+    if threading.current_thread() is not threading.main_thread():
+        return
+    
+    previous_handler = signal.getsignal(sig)
+    if not callable(previous_handler):
+        return
+    
+    def handler(signum, frame):
+        callback()
+        previous_handler(signum, frame)
+    signal.signal(sig, handler)
 
 def create_app() -> FastAPI:
     """Initialize and configure the FastAPI application."""
@@ -34,9 +53,19 @@ def create_app() -> FastAPI:
         # Start the background scheduler
         start_scheduler()
         
+        # Forward the change events published by the other worker processes
+        notifier = CalendarNotifier()
+        watch_task = asyncio.create_task(notifier.watch())
+        
+        # The server waits for open SSE streams before the shutdown below, end them on the stop signal
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            _run_before_signal_handler(sig, notifier.close)
+        
         yield # Keep the application running
         
-        # Stop the scheduler on shutdown
+        # Stop the scheduler and the change events on shutdown
+        notifier.close()
+        await watch_task
         stop_scheduler()
         logging.info("Stop backend")
     
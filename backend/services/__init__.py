@@ -1 +1,4 @@
-from .esport_calendar import EsportCalendarService
\ No newline at end of file
+from .esport_calendar import EsportCalendarService
+from .calendar_archive import CalendarArchiveService
+
+from .calendar_notifier import CalendarNotifier
\ No newline at end of file
@@ -0,0 +1,116 @@
+import os
+import re
+import shutil
+from datetime import datetime, timedelta
+import pytz
+from icalendar import Calendar
+from config.logs import LoggerManager
+from config.settings import get_settings
+
+ARCHIVE_DIR = os.path.join("static", "archive") # one ICS file per month and per closed season
+MONTH_FILE_PATTERN = re.compile(r"^(\d{4})-\d{2}\.ics$")
+
+class CalendarArchiveService:
+    def __init__(self):
+        # Initialize logger and the number of past days kept in the live calendar
+        self.logging = LoggerManager()
+        self.live_days = get_settings().BACK_CALENDAR_LIVE_DAYS
+
+    def cutoff(self):
+        """Return the UTC datetime before which events leave the live calendar."""
+        return datetime.now(pytz.UTC) - timedelta(days=self.live_days)
+
+    def is_archivable(self, event, cutoff):
+        """Check if an event started before the cutoff."""
+        return self.event_start(event) < cutoff
+
+    def archive_events(self, events):
+        """Merge events into their monthly archive files."""
+        months = {}
+        for event in events:
+            months.setdefault(self.event_start(event).strftime("%Y-%m"), []).append(event)
+
+        for month, month_events in months.items():
+            self._merge_month(month, month_events)
+            self.logging.info(f"Archived {len(month_events)} events in {month}.")
+
+    @staticmethod
+    def season_file_path(season):
+        """Return the path of a season archive file, or None if it has not been generated."""
+        file_path = os.path.join(ARCHIVE_DIR, f"season-{season}.ics")
+        return file_path if os.path.exists(file_path) else None
+
+    def _merge_month(self, month, events):
+        """Add or replace events in a monthly archive file."""
+        file_path = os.path.join(ARCHIVE_DIR, f"{month}.ics")
+        cal = self._load_calendar(file_path) or self._new_calendar(f"Esport Matches {month}")
+        uids = {event.get('uid') for event in events}
+
+        # Replace events already archived with the same UID
+        cal.subcomponents = [
+            comp for comp in cal.subcomponents
+            if not (comp.name == "VEVENT" and comp.get('uid') in uids)
+        ]
+        for event in events:
+            cal.add_component(event)
+        self._write_atomically(file_path, cal)
+
+    def build_closed_seasons(self, live_seasons):
+        """Generate season files once every event of the season is archived."""
+        if not os.path.isdir(ARCHIVE_DIR):
+            return
+
+        cutoff = self.cutoff()
+        seasons = {
+            int(match.group(1)) for match in map(MONTH_FILE_PATTERN.match, os.listdir(ARCHIVE_DIR))
+            if match
+        }
+
+        for season in sorted(seasons):
+            # A season is closed once the live window no longer reaches it
+            season_end = pytz.UTC.localize(datetime(season + 1, 1, 1))
+            # Events of a season still in the live calendar are not archived yet
+            if season_end > cutoff or season in live_seasons or self.season_file_path(season):
+                continue
+
+            cal = self._new_calendar(f"Esport Matches {season}")
+            for month in range(1, 13):
+                month_cal = self._load_calendar(os.path.join(ARCHIVE_DIR, f"{season}-{month:02d}.ics"))
+                if month_cal:
+                    for event in month_cal.walk('vevent'):
+                        cal.add_component(event)
+            self._write_atomically(os.path.join(ARCHIVE_DIR, f"season-{season}.ics"), cal)
+            self.logging.info(f"Season {season} archive generated.")
+
+    def _load_calendar(self, file_path):
+        """Load an archive calendar, or return None if it doesn't exist."""
+        if not os.path.exists(file_path):
+            return None
+        with open(file_path, 'rb') as f:
+            return Calendar.from_ical(f.read())
+
+    def _new_calendar(self, name):
+        """Create an empty archive calendar."""
+        cal = Calendar()
+        cal.add('version', '2.0')
+        cal.add('prodid', '-//esport calendar//')
+        cal.add('calscale', 'GREGORIAN')
+        cal.add('x-wr-calname', name)
+        return cal
+
+    def _write_atomically(self, file_path, cal):
+        """Write a calendar to a temporary file and move it in place."""
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        temp_file_path = f"{file_path}.tmp"
+        with open(temp_file_path, 'wb') as f:
+            f.write(cal.to_ical())
+        shutil.move(temp_file_path, file_path)
+
+    def event_start(self, event):
+        """Return the event start as an aware UTC datetime."""
+        start_time = event.decoded('dtstart')
+        if not isinstance(start_time, datetime):
+            start_time = datetime(start_time.year, start_time.month, start_time.day)
+        if not start_time.tzinfo:
+            start_time = pytz.UTC.localize(start_time)
+        return start_time
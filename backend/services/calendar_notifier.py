@@ -0,0 +1,147 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+import pytz
+import requests
+from watchfiles import awatch
+from config.logs import LoggerManager
+from config.settings import get_settings
+from utils.http_cache import get_file_etag
+
+class CalendarNotifier:
+    _subscribers = set() # class variable shared by every instance: (event loop, queue) of each SSE client
+    _last_version = None # class variable storing the last calendar version sent by this process
+    _closed = threading.Event() # class variable set when the server is stopping
+    _lock = threading.Lock()
+
+    def __init__(self):
+        # Initialize logger, the optional outgoing webhook and the file sharing the last event between workers
+        self.logging = LoggerManager()
+        settings = get_settings()
+        self.webhook_url = settings.BACK_WEBHOOK_URL
+        self.webhook_secret = settings.BACK_WEBHOOK_SECRET
+        self.event_file_path = os.path.join("static", "calendar_event.json")
+
+    def subscribe(self):
+        """Register a queue receiving change events, must be called from the event loop.
+
+        The queue receives None once the server is stopping.
+        """
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue())
+        with CalendarNotifier._lock:
+            CalendarNotifier._subscribers.add(subscriber)
+        if CalendarNotifier._closed.is_set():
+            subscriber[1].put_nowait(None)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """Remove a subscriber once its client is disconnected."""
+        with CalendarNotifier._lock:
+            CalendarNotifier._subscribers.discard(subscriber)
+
+    def close(self):
+        """End every SSE stream and the file watch so the server can shut down."""
+        CalendarNotifier._closed.set()
+        self._send_to_subscribers(None)
+
+    def current_event(self, file_path):
+        """Return the last change event of the current calendar version."""
+        if not os.path.exists(file_path):
+            return None
+        event = self._read_event_file()
+        if event and event["version"] == get_file_etag(os.stat(file_path)):
+            return event
+        return self._build_event(file_path, [])
+
+    def publish(self, file_path, changed_uids):
+        """Send a change event to SSE subscribers, to the other worker processes and to the webhook."""
+        event = self._build_event(file_path, sorted(changed_uids))
+
+        # Broadcast before sharing the event so the file watch of this process skips it
+        self._broadcast(event)
+
+        temp_event_file_path = f"{self.event_file_path}.tmp"
+        with open(temp_event_file_path, 'w') as f:
+            json.dump(event, f)
+        shutil.move(temp_event_file_path, self.event_file_path)
+
+        if self.webhook_url:
+            self._send_webhook(event)
+
+    def sync(self):
+        """Forward to local subscribers an event published by another worker process."""
+        event = self._read_event_file()
+        if event and event["version"] != CalendarNotifier._last_version:
+            self._broadcast(event)
+
+    async def watch(self):
+        """Call sync() each time the shared event file is written, until close() is called."""
+        event_dir, event_file_name = os.path.split(self.event_file_path)
+        os.makedirs(event_dir, exist_ok=True)
+        async for _ in awatch(
+            event_dir,
+            watch_filter=lambda change, path: os.path.basename(path) == event_file_name,
+            debounce=200,
+            recursive=False,
+            stop_event=CalendarNotifier._closed,
+        ):
+            self.sync()
+
+    def _broadcast(self, event):
+        """Send a change event to the SSE subscribers of this process."""
+        with CalendarNotifier._lock:
+            CalendarNotifier._last_version = event["version"]
+        count = self._send_to_subscribers(event)
+        self.logging.info(f"Change event {event['version']} sent to {count} subscribers.")
+
+    def _send_to_subscribers(self, event):
+        """Put a message in the queue of every subscriber and return their number."""
+        with CalendarNotifier._lock:
+            subscribers = list(CalendarNotifier._subscribers)
+        for loop, queue in subscribers:
+            try:
+                # The refresh runs in the scheduler thread, hand the event over to the client loop
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:
+                self.unsubscribe((loop, queue))
+        return len(subscribers)
+
+    def _send_webhook(self, event):
+        """Post the change event to the configured webhook."""
+        body = json.dumps(event).encode()
+        headers = {"Content-Type": "application/json"}
+
+        # Sign the body so the receiver can check it comes from us
+        if self.webhook_secret:
+            signature = hmac.new(self.webhook_secret.encode(), body, hashlib.sha256).hexdigest()
+            headers["X-Signature"] = f"sha256={signature}"
+
+        try:
+            response = requests.post(self.webhook_url, data=body, headers=headers, timeout=5)
+            response.raise_for_status()
+            self.logging.info(f"Change event {event['version']} sent to webhook.")
+        except requests.RequestException as e:
+            self.logging.error(f"Error sending change event to webhook: {e}")
+
+    def _read_event_file(self):
+        """Load the last event shared between worker processes, or None if there is none."""
+        try:
+            with open(self.event_file_path) as f:
+                event = json.load(f)
+            return event if "version" in event else None
+        except (OSError, ValueError):
+            return None
+
+    def _build_event(self, file_path, changed_uids):
+        """Create the change event payload of the calendar file."""
+        file_stat = os.stat(file_path)
+        return {
+            "version": get_file_etag(file_stat),
+            "changed_uids": changed_uids,
+            "updated_at": datetime.fromtimestamp(file_stat.st_mtime, pytz.UTC).isoformat(),
+        }
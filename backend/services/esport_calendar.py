@@ -7,6 +7,8 @@ from icalendar import Calendar, Event, vText
 from config.logs import LoggerManager
 from enums.game_mapping import GAME_FORMAT_MAPPING, GameFormat
 from services.esport_api import EsportAPIService
+from services.calendar_archive import CalendarArchiveService
+from services.calendar_notifier import CalendarNotifier
 from schemas.match_duo import MatchDuo
 from schemas.match_multi import MatchMulti
 
@@ -15,6 +17,8 @@ class EsportCalendarService:
         # Initialize logger, API service and team IDs for fetching matches
         self.logging = LoggerManager()
         self.api_service = EsportAPIService()
+        self.archive_service = CalendarArchiveService()
+        self.notifier = CalendarNotifier()
         self.team_ids = [
             134078,  # LOL KC
             128268,  # LOL KC blue
@@ -39,26 +43,37 @@ class EsportCalendarService:
             self.logging.info(f"Fetching matches for team ID: {team_id}")
             matches.extend(self.api_service.fetch_matches_for_team(team_id))
 
-        if matches:
-            self._generate_calendar_events(matches)
-            self._replace_calendar_atomically()
-            self.logging.info(f"Calendar updated with {len(matches)} matches.")
-        else:
+        if not matches:
             self.logging.warning("No matches fetched.")
 
+        # Past events are still archived without new matches, e.g. during the off-season
+        changed_uids, live_seasons = self._generate_calendar_events(matches)
+        if not changed_uids:
+            # Keep the file untouched so its ETag stays valid for clients
+            self.logging.info("Calendar unchanged.")
+        elif self._replace_calendar_atomically():
+            self.notifier.publish(self.ics_file_path, changed_uids)
+            self.logging.info(f"Calendar updated with {len(matches)} matches.")
+
+        self._build_closed_seasons(live_seasons)
+
         elapsed = time.perf_counter() - start_time
         self.logging.info(f"Calendar update completed in {elapsed} seconds.")
 
     def _load_existing_calendar(self):
-        """Load the existing calendar or create a new one if it doesn't exist."""
+        """Load the existing calendar, a new one if it doesn't exist, or None if it can't be parsed."""
         if os.path.exists(self.ics_file_path):
             try:
                 with open(self.ics_file_path, 'rb') as f:
                     return Calendar.from_ical(f.read())
             except Exception as e:
                 self.logging.error(f"Error loading calendar: {e}")
+                return None
                 
-        # Create a new calendar if none exists
+        return self._new_calendar()
+
+    def _new_calendar(self):
+        """Create a new empty calendar."""
         cal = Calendar()
         cal.add('version', '2.0')
         cal.add('prodid', '-//esport calendar//')
@@ -67,9 +82,17 @@ class EsportCalendarService:
         return cal
 
     def _generate_calendar_events(self, matches):
-        """Generate or update ICS events from the fetched matches."""
+        """Generate or update ICS events from the fetched matches.
+
+        Return the changed UIDs and the seasons still having events in the live calendar,
+        or None if the existing calendar couldn't be read.
+        """
         cal = self._load_existing_calendar()
+        calendar_loaded = cal is not None
+        if not calendar_loaded:
+            cal = self._new_calendar()
         existing_uids = {comp.get('uid') for comp in cal.walk('vevent') if comp.get('uid')}
+        previous_events = self._serialize_events(cal)
 
         for match in matches:
             # Generate events matches
@@ -88,19 +111,76 @@ class EsportCalendarService:
                 ]
             cal.add_component(event)
 
+        self._archive_past_events(cal)
+        live_seasons = None
+        if calendar_loaded:
+            live_seasons = {self.archive_service.event_start(comp).year for comp in cal.walk('vevent')}
+
+        # Compare with the previous content to find added, updated and archived events
+        current_events = self._serialize_events(cal)
+        changed_uids = {
+            uid for uid in previous_events.keys() | current_events.keys()
+            if previous_events.get(uid) != current_events.get(uid)
+        }
+        if not changed_uids:
+            return changed_uids, live_seasons
+
         with open(self.temp_ics_file_path, 'wb') as f:
             f.write(cal.to_ical())
-        self.logging.info("Temporary calendar file generated.")
+        self.logging.info(f"Temporary calendar file generated with {len(changed_uids)} changed events.")
+        return changed_uids, live_seasons
+
+    def _serialize_events(self, cal):
+        """Map each event UID to its ICS content."""
+        return {str(comp.get('uid')): comp.to_ical() for comp in cal.walk('vevent') if comp.get('uid')}
+
+    def _archive_past_events(self, cal):
+        """Move events older than the live window from the calendar to the archive."""
+        cutoff = self.archive_service.cutoff()
+        past_events = [
+            comp for comp in cal.subcomponents
+            if comp.name == "VEVENT" and self.archive_service.is_archivable(comp, cutoff)
+        ]
+        if not past_events:
+            return
+
+        try:
+            self.archive_service.archive_events(past_events)
+        except Exception as e:
+            # Keep the events in the live calendar so nothing is lost
+            self.logging.error(f"Error archiving past events: {e}")
+            return
+
+        past_uids = {comp.get('uid') for comp in past_events}
+        cal.subcomponents = [
+            comp for comp in cal.subcomponents
+            if not (comp.name == "VEVENT" and comp.get('uid') in past_uids)
+        ]
+        self.logging.info(f"Moved {len(past_events)} past events to the archive.")
+
+    def _build_closed_seasons(self, live_seasons):
+        """Generate the archive of seasons that are over, on every refresh."""
+        # Without the live calendar, a season still having live events could be generated too early
+        if live_seasons is None:
+            self.logging.warning("Season archives skipped, the live calendar couldn't be read.")
+            return
+
+        try:
+            self.archive_service.build_closed_seasons(live_seasons)
+        except Exception as e:
+            self.logging.error(f"Error building season archives: {e}")
 
     def _replace_calendar_atomically(self):
         """Replace the old calendar file with the new one atomically."""
         try:
             shutil.move(self.temp_ics_file_path, self.ics_file_path)
             self.logging.info("Calendar file updated successfully.")
+            return True
         except Exception as e:
             self.logging.error(f"Error replacing calendar file: {e}")
             if os.path.exists(self.temp_ics_file_path):
                 os.remove(self.temp_ics_file_path)
+            return False
 
     def _calendar_event_duo(self, match: MatchDuo):
         """Create an ICS event for a duo-team match."""
@@ -0,0 +1,17 @@
+import os
+import sys
+
+# Settings are loaded from the environment, define the required ones before importing the backend
+os.environ.setdefault("ENVIRONMENT", "dev")
+os.environ.setdefault("BACK_NAME", "kcalendar")
+os.environ.setdefault("BACK_VERSION", "0.0.0")
+os.environ.setdefault("BACK_DESCRIPTION", "tests")
+os.environ.setdefault("BACK_CACHE_DURATION", "5")
+os.environ.setdefault("BACK_LOGGING_LEVEL", "INFO")
+os.environ.setdefault("BACK_LOG_MAX_BYTES", "100000")
+os.environ.setdefault("BACK_LOG_BACKUP_COUNT", "1")
+os.environ.setdefault("BACK_PANDA_BASE_URL", "http://127.0.0.1")
+os.environ.setdefault("BACK_PANDA_API_KEY", "test")
+os.environ.setdefault("BACK_PANDA_REFRESH_INTERVAL", "5")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,127 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from icalendar import Calendar, Event
+
+@pytest.fixture(autouse=True)
+def static_dir(monkeypatch, tmp_path):
+    # Archive files are written relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "static"
+
+def _make_event(uid, start, summary="KC vs FNC"):
+    event = Event()
+    event.add('uid', uid)
+    event.add('summary', summary)
+    event.add('dtstart', start)
+    event.add('duration', timedelta(hours=2))
+    return event
+
+def _read_events(file_path):
+    """Map each event UID of an ICS file to its summary."""
+    with open(file_path, 'rb') as f:
+        cal = Calendar.from_ical(f.read())
+    return {str(event.get('uid')): str(event.get('summary')) for event in cal.walk('vevent')}
+
+def test_past_events_move_to_monthly_archive(static_dir):
+    from services.esport_calendar import EsportCalendarService
+
+    now = datetime.now(timezone.utc)
+    service = EsportCalendarService()
+    cal = service._new_calendar()
+    cal.add_component(_make_event("past@esport_calendar", datetime(2024, 3, 1, 18, tzinfo=timezone.utc)))
+    cal.add_component(_make_event("recent@esport_calendar", now - timedelta(days=1)))
+    cal.add_component(_make_event("next@esport_calendar", now + timedelta(days=1)))
+
+    service._archive_past_events(cal)
+
+    assert {str(event.get('uid')) for event in cal.walk('vevent')} == {"recent@esport_calendar", "next@esport_calendar"}
+    assert list(_read_events(static_dir / "archive" / "2024-03.ics")) == ["past@esport_calendar"]
+
+def test_monthly_merge_replaces_event_with_same_uid(static_dir):
+    from services.calendar_archive import CalendarArchiveService
+
+    archive_service = CalendarArchiveService()
+    start = datetime(2024, 3, 1, 18, tzinfo=timezone.utc)
+    archive_service.archive_events([_make_event("1@esport_calendar", start, "Old summary")])
+    archive_service.archive_events([
+        _make_event("1@esport_calendar", start, "New summary"),
+        _make_event("2@esport_calendar", start + timedelta(days=1)),
+    ])
+
+    assert _read_events(static_dir / "archive" / "2024-03.ics") == {
+        "1@esport_calendar": "New summary",
+        "2@esport_calendar": "KC vs FNC",
+    }
+
+def test_closed_seasons_are_built_once(static_dir):
+    from services.calendar_archive import CalendarArchiveService
+
+    archive_service = CalendarArchiveService()
+    current_year = datetime.now(timezone.utc).year
+    archive_service.archive_events([
+        _make_event("2020@esport_calendar", datetime(2020, 6, 1, tzinfo=timezone.utc)),
+        _make_event("2021@esport_calendar", datetime(2021, 6, 1, tzinfo=timezone.utc)),
+        _make_event("current@esport_calendar", datetime(current_year, 1, 1, tzinfo=timezone.utc)),
+    ])
+    # Other ICS files in the archive are ignored
+    (static_dir / "archive" / "notes.ics").write_text("")
+
+    # 2021 still has events in the live calendar and the current season is not over
+    archive_service.build_closed_seasons({2021})
+    assert sorted(name for name in os.listdir(static_dir / "archive") if name.startswith("season-")) == ["season-2020.ics"]
+    assert list(_read_events(CalendarArchiveService.season_file_path(2020))) == ["2020@esport_calendar"]
+
+    # A generated season is never rebuilt
+    archive_service.archive_events([_make_event("late@esport_calendar", datetime(2020, 7, 1, tzinfo=timezone.utc))])
+    archive_service.build_closed_seasons(set())
+    assert list(_read_events(CalendarArchiveService.season_file_path(2020))) == ["2020@esport_calendar"]
+    assert CalendarArchiveService.season_file_path(2021)
+    assert CalendarArchiveService.season_file_path(current_year) is None
+
+def test_refresh_without_matches_builds_closed_seasons(static_dir, monkeypatch):
+    from services.calendar_archive import CalendarArchiveService
+    from services.esport_calendar import EsportCalendarService
+
+    CalendarArchiveService().archive_events([_make_event("2020@esport_calendar", datetime(2020, 6, 1, tzinfo=timezone.utc))])
+    service = EsportCalendarService()
+    monkeypatch.setattr(service.api_service, "fetch_matches_for_team", lambda team_id: [])
+
+    # A live calendar which can't be read may still hold events of the season
+    (static_dir / "calendar.ics").write_text("not a calendar")
+    service.update_calendar()
+    assert CalendarArchiveService.season_file_path(2020) is None
+
+    os.remove(static_dir / "calendar.ics")
+    service.update_calendar()
+    assert CalendarArchiveService.season_file_path(2020)
+
+def test_archive_endpoint(static_dir):
+    from api.routes import file
+    from services.calendar_archive import CalendarArchiveService
+
+    app = FastAPI()
+    app.include_router(file.router)
+    client = TestClient(app)
+
+    assert client.get("/archive/2020.ics").status_code == 404
+
+    archive_service = CalendarArchiveService()
+    archive_service.archive_events([_make_event("2020@esport_calendar", datetime(2020, 6, 1, tzinfo=timezone.utc))])
+    archive_service.build_closed_seasons(set())
+
+    response = client.get("/archive/2020.ics")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert "2020@esport_calendar" in response.text
+
+    for headers in ({"if-none-match": response.headers["etag"]}, {"if-modified-since": response.headers["last-modified"]}):
+        not_modified = client.get("/archive/2020.ics", headers=headers)
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == response.headers["etag"]
+        assert not_modified.headers["cache-control"] == response.headers["cache-control"]
+
+    assert client.get("/archive/2020.ics", headers={"if-modified-since": "garbage"}).status_code == 200
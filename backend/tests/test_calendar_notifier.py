@@ -0,0 +1,191 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from starlette.requests import Request
+
+from config.settings import get_settings
+
+WEBHOOK_SECRET = "s3cret"
+
+class StubReceiver(BaseHTTPRequestHandler):
+    """Local webhook receiver storing each POST with its signature check."""
+    received = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        expected = "sha256=" + hmac.new(WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+        StubReceiver.received.append({
+            "valid_signature": hmac.compare_digest(self.headers.get("X-Signature", ""), expected),
+            "event": json.loads(body),
+        })
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def webhook_receiver(monkeypatch, tmp_path):
+    # Run the stub receiver in a thread and point the webhook settings to it
+    server = HTTPServer(("127.0.0.1", 0), StubReceiver)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    StubReceiver.received = []
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BACK_WEBHOOK_URL", f"http://127.0.0.1:{server.server_port}/hook")
+    monkeypatch.setenv("BACK_WEBHOOK_SECRET", WEBHOOK_SECRET)
+    get_settings.cache_clear()
+    yield StubReceiver.received
+
+    server.shutdown()
+    get_settings.cache_clear()
+
+def _make_request():
+    """Build a request of a client which never disconnects."""
+    async def receive():
+        await asyncio.Event().wait()
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [], "client": ("127.0.0.1", 1234)}
+    return Request(scope, receive)
+
+def _parse_message(message):
+    """Return the JSON data of a Server-Sent Event message."""
+    data = next(line for line in message.splitlines() if line.startswith("data: "))
+    return json.loads(data[len("data: "):])
+
+def test_webhook_and_sse_receive_same_event(webhook_receiver, tmp_path):
+    from api.routes.events import stream_calendar_events
+    from services.calendar_notifier import CalendarNotifier
+
+    (tmp_path / "static").mkdir()
+    file_path = tmp_path / "static" / "calendar.ics"
+    file_path.write_text("BEGIN:VCALENDAR\nEND:VCALENDAR\n")
+
+    async def run():
+        response = await stream_calendar_events(_make_request())
+        stream = response.body_iterator
+        try:
+            assert (await anext(stream)).startswith("retry: ")
+            assert _parse_message(await anext(stream))["changed_uids"] == []
+
+            # Publish from another thread like the scheduler does
+            await asyncio.to_thread(CalendarNotifier().publish, str(file_path), {"2@esport_calendar", "1@esport_calendar"})
+            return _parse_message(await anext(stream))
+        finally:
+            await stream.aclose()
+
+    sse_event = asyncio.run(run())
+
+    assert len(webhook_receiver) == 1
+    assert webhook_receiver[0]["valid_signature"]
+    assert webhook_receiver[0]["event"] == sse_event
+    assert sse_event["changed_uids"] == ["1@esport_calendar", "2@esport_calendar"]
+    assert CalendarNotifier._subscribers == set()
+
+def test_no_publish_when_calendar_unchanged(webhook_receiver, monkeypatch):
+    from schemas.match_duo import MatchDuo
+    from services.esport_calendar import EsportCalendarService
+
+    match = MatchDuo(
+        id="1",
+        tournament_name="Tournament",
+        tournament_slug="tournament",
+        tournament_tier="s",
+        videogame_name="Valorant",
+        videogame_slug="valorant",
+        number_of_games=3,
+        begin_at=datetime.now(timezone.utc) + timedelta(days=1),
+        duration=timedelta(hours=2),
+        slug="kc-vs-fnc",
+        league_name="VCT",
+        stream_url="",
+        opponents=[{"name": "Karmine Corp"}, {"name": "Fnatic"}],
+    )
+    service = EsportCalendarService()
+    monkeypatch.setattr(service.api_service, "fetch_matches_for_team", lambda team_id: [match] if team_id == service.team_ids[0] else [])
+
+    service.update_calendar()
+    service.update_calendar()
+
+    assert len(webhook_receiver) == 1
+    assert webhook_receiver[0]["event"]["changed_uids"] == ["1@esport_calendar"]
+
+def test_sync_forwards_event_published_by_another_worker(webhook_receiver, tmp_path):
+    from services.calendar_notifier import CalendarNotifier
+
+    (tmp_path / "static").mkdir()
+    file_path = tmp_path / "static" / "calendar.ics"
+    file_path.write_text("BEGIN:VCALENDAR\nEND:VCALENDAR\n")
+    CalendarNotifier().publish(str(file_path), {"1@esport_calendar"})
+
+    async def run():
+        notifier = CalendarNotifier()
+        subscriber = notifier.subscribe()
+        _, queue = subscriber
+        try:
+            # The calendar is rewritten but its event is not shared yet, nothing is sent
+            file_path.write_text("BEGIN:VCALENDAR\nVERSION:2.0\nEND:VCALENDAR\n")
+            notifier.sync()
+            assert queue.empty()
+
+            # Another worker process has not seen the shared event yet
+            CalendarNotifier._last_version = None
+            notifier.sync()
+            notifier.sync()
+            event = await asyncio.wait_for(queue.get(), timeout=1)
+            assert queue.empty()
+            return event
+        finally:
+            notifier.unsubscribe(subscriber)
+
+    assert asyncio.run(run()) == webhook_receiver[0]["event"]
+
+def test_watch_forwards_event_file_changes(webhook_receiver, tmp_path, monkeypatch):
+    from services.calendar_notifier import CalendarNotifier
+
+    monkeypatch.setattr(CalendarNotifier, "_closed", threading.Event())
+    shared_event = {"version": "other-worker", "changed_uids": ["1@esport_calendar"], "updated_at": "2026-01-01T00:00:00+00:00"}
+
+    async def run():
+        notifier = CalendarNotifier()
+        subscriber = notifier.subscribe()
+        _, queue = subscriber
+        watch_task = asyncio.create_task(notifier.watch())
+        try:
+            await asyncio.sleep(0.5) # let the watcher start
+            (tmp_path / "static" / "calendar_event.json").write_text(json.dumps(shared_event))
+            event = await asyncio.wait_for(queue.get(), timeout=5)
+
+            notifier.close()
+            await asyncio.wait_for(watch_task, timeout=5)
+            assert await queue.get() is None
+            return event
+        finally:
+            notifier.unsubscribe(subscriber)
+
+    assert asyncio.run(run()) == shared_event
+
+def test_stream_ends_when_server_stops(webhook_receiver, monkeypatch):
+    from api.routes.events import stream_calendar_events
+    from services.calendar_notifier import CalendarNotifier
+
+    monkeypatch.setattr(CalendarNotifier, "_closed", threading.Event())
+
+    async def run():
+        response = await stream_calendar_events(_make_request())
+        # Nothing is subscribed until the body is streamed
+        assert CalendarNotifier._subscribers == set()
+
+        stream = response.body_iterator
+        assert (await anext(stream)).startswith("retry: ")
+        asyncio.get_running_loop().call_later(0.1, CalendarNotifier().close)
+        with pytest.raises(StopAsyncIteration):
+            await anext(stream)
+
+    asyncio.run(run())
+    assert CalendarNotifier._subscribers == set()
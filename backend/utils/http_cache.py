@@ -0,0 +1,5 @@
+import hashlib
+
+def get_file_etag(file_stat):
+    """Generate an ETag which is a unique identifier hash for the file from its stat result."""
+    return hashlib.md5(f"{file_stat.st_mtime}:{file_stat.st_size}".encode()).hexdigest()